@@ -1,3 +1,5 @@
+import json
+
 import folium
 import geopandas as gpd
 import matplotlib.cm as cm
@@ -9,6 +11,15 @@ import pandas as pd
 import pytest
 
 from geopandas_view import view
+from geopandas_view.view import (
+    _CLASSIFY_CACHE,
+    _CLASSIFY_CACHE_SIZE,
+    _classify,
+    _colormap_colors,
+    _feature_collection,
+    _iter_features,
+    _rgba_to_hex,
+)
 
 nybb = gpd.read_file(gpd.datasets.get_path("nybb"))
 world = gpd.read_file(gpd.datasets.get_path("naturalearth_lowres"))
@@ -130,6 +141,17 @@ def test_simple_color():
     out_str = _fetch_map_string(m4)
     assert '"fillColor":"red"' in out_str
 
+    # missing values in colors
+    m5 = view(world, color=world.continent.map({"Africa": "red"}))
+    out_str = _fetch_map_string(m5)
+    assert '"fillColor":"red"' in out_str
+    assert '"fillColor":null' in out_str
+
+    m6 = view(nybb, color=np.array(["red", np.nan, "blue", None, "red"], dtype=object))
+    out_str = _fetch_map_string(m6)
+    assert '"fillColor":"blue"' in out_str
+    assert '"fillColor":null' in out_str
+
 
 def test_choropleth_linear():
     """Check choropleth colors"""
@@ -250,6 +272,36 @@ def test_categories():
     assert '"StatenIsland","__folium_color":"#98df8a"' in out_str
     assert '"Queens","__folium_color":"#8c564b"' in out_str
 
+    # values not listed in categories are treated as missing
+    m = view(
+        nybb[["BoroName", "geometry"]],
+        column="BoroName",
+        categories=["Brooklyn", "Queens"],
+        missing_kwds=dict(color="red"),
+    )
+    out_str = _fetch_map_string(m)
+    assert '"Bronx","__folium_color":"red"' in out_str
+    assert '"Brooklyn","__folium_color":"#1f77b4"' in out_str
+    assert '"Queens","__folium_color":"#9edae5"' in out_str
+
+    with pytest.raises(ValueError, match="categories must be unique"):
+        view(nybb, column="BoroName", categories=["Queens", "Queens"])
+
+    # categories applied to a categorical array
+    m = view(
+        nybb,
+        column=pd.Series(pd.Categorical(list("xyzxy"))),
+        categorical=True,
+        categories=["z", "y", "x"],
+        cmap=["red", "green", "blue"],
+        legend=True,
+    )
+    out_str = _fetch_map_string(m)
+    assert "red'></span>z" in out_str
+    assert "green'></span>y" in out_str
+    assert "blue'></span>x" in out_str
+    assert '"fillColor":"blue"' in out_str
+
     df = nybb.copy()
     df["categorical"] = pd.Categorical(df["BoroName"])
     with pytest.raises(ValueError, match="Cannot specify 'categories'"):
@@ -300,6 +352,8 @@ def test_no_crs():
     df.crs = None
     m = view(df)
     assert "openstreetmap" not in m.to_dict()["children"].keys()
+    # the map is not in a Simple CRS, fitting bounds is what frames the data
+    assert "fitBounds" in _fetch_map_string(m)
 
 
 def test_style_kwds():
@@ -721,3 +775,218 @@ def test_custom_colormaps():
 
     for s in strings:
         assert s in _fetch_map_string(m)
+
+
+def test_classify_cache():
+    values = world["pop_est"].to_numpy()
+    b1 = _classify(values, "quantiles", k=5)
+    b2 = _classify(values.copy(), "quantiles", k=5)
+    assert b1 is b2
+    b3 = _classify(values, "quantiles", k=4)
+    assert b3 is not b1
+    assert b3.k == 4
+
+    # the cache is bounded
+    for k in range(6, 6 + _CLASSIFY_CACHE_SIZE):
+        _classify(values, "quantiles", k=k)
+    assert len(_CLASSIFY_CACHE) == _CLASSIFY_CACHE_SIZE
+    assert _classify(values, "quantiles", k=5) is not b1
+
+    # unhashable options bypass the cache
+    b4 = _classify(values, "userdefined", bins=[1e7, 1e8])
+    b5 = _classify(values, "userdefined", bins=[1e7, 1e8])
+    assert b4 is not b5
+    np.testing.assert_array_equal(b4.yb, b5.yb)
+
+
+def test_feature_collection():
+    fc = json.loads(_feature_collection(missing))
+    assert fc["type"] == "FeatureCollection"
+    assert len(fc["features"]) == len(missing)
+    assert [f["id"] for f in fc["features"]] == missing.index.astype(str).to_list()
+    expected = json.loads(missing.to_json())
+    for feature, exp in zip(fc["features"], expected["features"]):
+        assert feature["geometry"] == exp["geometry"]
+        assert feature["properties"] == exp["properties"]
+
+    # GeoSeries has no properties
+    fc = json.loads(_feature_collection(nybb.geometry))
+    assert all(f["properties"] == {} for f in fc["features"])
+
+
+def test_iter_features():
+    chunks = list(_iter_features(world, chunksize=50))
+    assert len(chunks) == int(np.ceil(len(world) / 50))
+    features = json.loads("[" + ",".join(chunks) + "]")
+    assert len(features) == len(world)
+    assert json.loads(_feature_collection(world))["features"] == features
+
+    assert json.loads(_feature_collection(world.iloc[:0]))["features"] == []
+
+    # geometry only
+    for geoms in [world.geometry, world[["geometry"]]]:
+        features = json.loads(_feature_collection(geoms))["features"]
+        assert all(f["properties"] == {} for f in features)
+
+
+def test_plottable_column_not_embedded():
+    m = view(world, column=world["pop_est"].to_numpy())
+    out_str = _fetch_map_string(m)
+    assert "__plottable_column" not in out_str
+    assert "__folium_color" in out_str
+
+
+def test_colormap_colors():
+    expected = np.apply_along_axis(
+        colors.to_hex, 1, cm.get_cmap("viridis", 5)(range(5))
+    )
+    np.testing.assert_array_equal(_colormap_colors("viridis", 5), expected)
+    assert _colormap_colors("viridis", 5) is _colormap_colors("viridis", 5)
+
+    # unhashable Colormap object
+    cmap = cm.get_cmap("viridis")
+    np.testing.assert_array_equal(
+        _colormap_colors(cmap, 5),
+        np.apply_along_axis(colors.to_hex, 1, cm.get_cmap(cmap, 5)(range(5))),
+    )
+
+
+def test_rgba_to_hex():
+    rgba = np.random.default_rng(0).random((1000, 4))
+    # values exactly halfway between two bytes
+    rgba[:255, 0] = (np.arange(255) + 0.5) / 255
+    np.testing.assert_array_equal(
+        _rgba_to_hex(rgba), np.apply_along_axis(colors.to_hex, 1, rgba)
+    )
+
+
+def test_simplify():
+    full = _fetch_map_string(view(nybb))
+    auto = _fetch_map_string(view(nybb, simplify="auto"))
+    custom = _fetch_map_string(view(nybb, simplify=0.01))
+    assert len(custom) < len(auto) < len(full)
+    assert auto.count("MultiPolygon") == full.count("MultiPolygon")
+
+    # GeoSeries
+    m = view(nybb.geometry, simplify="auto")
+    assert len(_fetch_map_string(m)) < len(full)
+
+    for invalid in ["nonsense", True, [1]]:
+        with pytest.raises(ValueError, match="'simplify' must be"):
+            view(nybb, simplify=invalid)
+
+
+def test_input_not_modified():
+    df = nybb.copy()
+    df["geometry"] = df.explode(index_parts=False).exterior.iloc[:5].values
+    expected = df.copy()
+    view(df, column=np.arange(5), color=None)
+    view(df, "BoroCode", simplify="auto", missing_kwds={"color": "red"})
+    assert df.columns.to_list() == expected.columns.to_list()
+    assert df.crs == expected.crs
+    assert (df.geom_type == "LinearRing").all()
+    assert df.geom_equals(expected).all()
+
+
+def test_feature_ids():
+    df = nybb.set_index("BoroName")
+    df.index = df.index.str.replace("Queens", 'Que"ens')
+    fc = json.loads(_feature_collection(df))
+    assert [f["id"] for f in fc["features"]] == df.index.to_list()
+
+    fc = json.loads(_feature_collection(nybb.set_index("BoroCode")))
+    assert [f["id"] for f in fc["features"]] == ["5", "4", "3", "1", "2"]
+
+
+def test_minimal_properties():
+    m = view(world, tooltip="name", popup=["iso_a3"], minimal_properties=True)
+    out_str = _fetch_map_string(m)
+    assert '"properties":{"iso_a3":"FJI","name":"Fiji"}' in out_str
+    assert "gdp_md_est" not in out_str
+
+    m = view(world, column="continent", tooltip=False, minimal_properties=True)
+    out_str = _fetch_map_string(m)
+    assert '"properties":{"__folium_color":"#7f7f7f"}' in out_str
+
+    df = world.copy()
+    df["colors"] = "red"
+    m = view(df, color="colors", tooltip=False, minimal_properties=True)
+    assert '"properties":{"colors":"red"}' in _fetch_map_string(m)
+
+    # default keeps all columns
+    m = view(world, tooltip=False)
+    assert "gdp_md_est" in _fetch_map_string(m)
+
+
+def test_cluster():
+    points = world.copy()
+    points["geometry"] = world.representative_point()
+    m = view(points, cluster=True)
+    out_str = _fetch_map_string(m)
+    assert "L.markerClusterGroup" in out_str
+    assert "geo_json" not in out_str
+
+    # layer keywords are passed to the cluster, others are ignored with a warning
+    m = view(points, cluster=True, name="points", show=False)
+    cluster = [c for c in m._children.values() if c._name == "FastMarkerCluster"]
+    assert cluster[0].layer_name == "points"
+    assert cluster[0].show is False
+    with pytest.warns(UserWarning, match="not supported with 'cluster=True'"):
+        view(points, cluster=True, smooth_factor=2)
+
+    # clustered points are not colored, no legend is added
+    with pytest.warns(UserWarning, match="'column' is not supported"):
+        m = view(points, "pop_est", cluster=True)
+    out_str = _fetch_map_string(m)
+    assert "L.markerClusterGroup" in out_str
+    assert "color_map" not in out_str
+
+    # not only points
+    m = view(world, cluster=True)
+    out_str = _fetch_map_string(m)
+    assert "L.markerClusterGroup" not in out_str
+    assert "geo_json" in out_str
+
+
+def test_tooltip_fields_not_modified():
+    fields = ["pop_est", "__folium_color"]
+    m = view(world, column="continent", tooltip=fields)
+    assert 'fields=["pop_est"]' in _fetch_map_string(m)
+    assert fields == ["pop_est", "__folium_color"]
+
+
+def test_categorical_legend_header_once():
+    m = view(world, "continent", legend=True)
+    m = view(world, "name", legend=True, m=m)
+    out_str = _fetch_map_string(m)
+    assert out_str.count("jquery-ui.js") == 1
+    assert "Africa" in out_str
+    assert "Fiji" in out_str
+
+
+def test_scheme_colors_match_legend():
+    m = view(
+        world,
+        "pop_est",
+        scheme="quantiles",
+        classification_kwds=dict(k=3),
+        legend=True,
+        legend_kwds=dict(colorbar=False),
+    )
+    out_str = _fetch_map_string(m)
+    for color in _colormap_colors("viridis", 3):
+        assert f'"__folium_color":"{color}"' in out_str
+        assert f"{color}'></span>" in out_str
+
+
+def test_list_cmap_numeric():
+    # a list of colors is only valid for categorical plots
+    with pytest.raises(ValueError, match="is not a valid value"):
+        view(world, "pop_est", cmap=["red", "blue"])
+    with pytest.raises(ValueError, match="is not a valid value"):
+        view(world, "pop_est", cmap=["red", "blue"], scheme="quantiles")
+    m = view(world, "continent", cmap=["red", "blue"], legend=True)
+    out_str = _fetch_map_string(m)
+    assert "red'></span>Africa" in out_str
+    assert "blue'></span>Antarctica" in out_str
+    assert "red'></span>Asia" in out_str
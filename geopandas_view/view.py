@@ -1,37 +1,57 @@
-from statistics import mean
+import hashlib
+import json
+import numbers
+from collections import OrderedDict
+from functools import lru_cache
 from warnings import warn
 
 import branca as bc
 import folium
+from folium import plugins
 import geopandas as gpd
 from shapely.geometry import LineString
-import mapclassify
+import matplotlib
 import matplotlib.cm as cm
-import matplotlib.colors as colors
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-
-_MAP_KWARGS = [
-    "location",
-    "prefer_canvas",
-    "no_touch",
-    "disable_3d",
-    "png_enabled",
-    "zoom_control",
-    "crs",
-    "zoom_start",
-    "left",
-    "top",
-    "position",
-    "min_zoom",
-    "max_zoom",
-    "min_lat",
-    "max_lat",
-    "min_lon",
-    "max_lon",
-    "max_bounds",
-]
+import shapely
+
+_MAP_KWARGS = frozenset(
+    {
+        "location",
+        "prefer_canvas",
+        "no_touch",
+        "disable_3d",
+        "png_enabled",
+        "zoom_control",
+        "crs",
+        "zoom_start",
+        "left",
+        "top",
+        "position",
+        "min_zoom",
+        "max_zoom",
+        "min_lat",
+        "max_lat",
+        "min_lon",
+        "max_lon",
+        "max_bounds",
+    }
+)
+
+# keywords passed to folium.plugins.FastMarkerCluster when clustering
+_CLUSTER_KWARGS = frozenset({"name", "overlay", "control", "show", "options"})
+
+# most recently used mapclassify results, see _classify; each one keeps its
+# classified values alive
+_CLASSIFY_CACHE = OrderedDict()
+_CLASSIFY_CACHE_SIZE = 4
+
+# helper columns view() may add to the data, never shown to the user
+_INTERNAL_COLS = frozenset({"__plottable_column", "__folium_color"})
+
+# two-digit hex codes of all byte values, used to format colors in bulk
+_BYTE_HEX = np.array([f"{i:02x}" for i in range(256)])
 
 
 def view(
@@ -64,6 +84,9 @@ def view(
     tooltip_kwds={},
     popup_kwds={},
     legend_kwds={},
+    simplify=None,
+    minimal_properties=False,
+    cluster=False,
     **kwargs,
 ):
     """Interactive map based on GeoPandas and folium/leaflet.js
@@ -147,6 +170,7 @@ def view(
         m is given explicitly, height is ignored.
     categories : list-like
         Ordered list-like object of categories to be used for categorical plot.
+        Values not listed in categories are plotted as missing values.
     classification_kwds : dict (default None)
         Keyword arguments to pass to mapclassify
     control_scale : bool, (default True)
@@ -229,6 +253,24 @@ def view(
             If True, open/closed interval brackets are shown in the legend.
             Applies if ``colorbar=False``.
 
+    simplify : float, str (default None)
+        Simplify geometries before embedding them in the map to reduce the size
+        of the output. A float is used as the tolerance in degrees (or in
+        the units of the data if they have no CRS). ``"auto"`` derives the
+        tolerance from the extent of the data so that the simplification is not
+        visible at the initial zoom. ``None`` keeps geometries intact.
+    minimal_properties : bool (default False)
+        Embed only the columns used by the tooltip, popup and styling in the
+        map. Other columns are left out of the output, which considerably
+        reduces its size for wide GeoDataFrames.
+    cluster : bool (default False)
+        Cluster points using ``folium.plugins.FastMarkerCluster`` instead of
+        drawing each of them, which keeps maps of large point datasets
+        responsive. Styling, tooltip, popup, markers and the legend of
+        ``column`` are not applied to clustered points. Of the additional ``**kwargs``, only ``name``,
+        ``overlay``, ``control``, ``show`` and ``options`` are passed to the
+        cluster, others are ignored with a warning. Ignored unless all
+        geometries are Points.
     **kwargs : dict
         Additional options to be passed on to the folium.Map or folium.GeoJson.
 
@@ -238,40 +280,61 @@ def view(
         Folium map instance
 
     """
-    gdf = df.copy()
+    # shallow copy, geometries and columns are replaced, never modified in place
+    gdf = df.copy(deep=False)
 
     # convert LinearRing to LineString
     rings_mask = df.geom_type == "LinearRing"
     if rings_mask.any():
-        gdf.geometry[rings_mask] = gdf.geometry[rings_mask].apply(
-            lambda g: LineString(g)
-        )
+        geoms = gdf.geometry.copy()
+        geoms[rings_mask] = geoms[rings_mask].apply(lambda g: LineString(g))
+        gdf = _set_geometry(gdf, geoms)
 
     if gdf.crs is None:
         crs = "Simple"
         tiles = None
     elif not gdf.crs.equals(4326):
-        gdf = gdf.to_crs(4326)
+        # reproject the geometry array alone (vectorized transform), gdf is
+        # already a copy so there is no need for to_crs to copy it again
+        gdf = _set_geometry(gdf, gdf.geometry.values.to_crs(4326))
+
+    if simplify is not None:
+        if isinstance(simplify, str) and simplify == "auto":
+            minx, miny, maxx, maxy = shapely.total_bounds(
+                np.asarray(gdf.geometry.values)
+            )
+            simplify = max(maxx - minx, maxy - miny) / 4000
+        elif isinstance(simplify, (bool, np.bool_)) or not isinstance(
+            simplify, numbers.Real
+        ):
+            raise ValueError("'simplify' must be a float tolerance, 'auto' or None.")
+        gdf = _set_geometry(gdf, gdf.geometry.simplify(simplify))
+
+    # split kwargs to be passed to folium.Map from those for folium.GeoJson
+    map_kwds = {i: kwargs.pop(i) for i in _MAP_KWARGS if i in kwargs}
 
     # create folium.Map object
     if m is None:
         # Get bounds to specify location and map extent
-        bounds = gdf.total_bounds
-        location = kwargs.pop("location", None)
+        geom_bounds = shapely.bounds(np.asarray(gdf.geometry.values))
+        bounds = np.concatenate(
+            [
+                np.nanmin(geom_bounds[:, :2], axis=0),
+                np.nanmax(geom_bounds[:, 2:], axis=0),
+            ]
+        )
+        location = map_kwds.pop("location", None)
         if location is None:
-            x = mean([bounds[0], bounds[2]])
-            y = mean([bounds[1], bounds[3]])
+            x = (bounds[0] + bounds[2]) / 2
+            y = (bounds[1] + bounds[3]) / 2
             location = (y, x)
-            if "zoom_start" in kwargs.keys():
+            if "zoom_start" in map_kwds:
                 fit = False
             else:
                 fit = True
         else:
             fit = False
 
-        # get a subset of kwargs to be passed to folium.Map
-        map_kwds = {i: kwargs[i] for i in kwargs.keys() if i in _MAP_KWARGS}
-
         # contextily.providers object
         if hasattr(tiles, "url") and hasattr(tiles, "attribution"):
             attr = attr if attr else tiles["attribution"]
@@ -295,9 +358,6 @@ def view(
         if fit:
             m.fit_bounds([[bounds[1], bounds[0]], [bounds[3], bounds[2]]])
 
-    for map_kwd in _MAP_KWARGS:
-        kwargs.pop(map_kwd, None)
-
     nan_idx = None
 
     if column is not None:
@@ -310,38 +370,52 @@ def view(
                 column_name = "__plottable_column"
                 gdf[column_name] = column
                 column = column_name
-        elif pd.api.types.is_categorical_dtype(gdf[column]):
-            if categories is not None:
-                raise ValueError(
-                    "Cannot specify 'categories' when column has categorical dtype"
-                )
-            categorical = True
-        elif gdf[column].dtype is np.dtype("O") or categories:
-            categorical = True
+            values = gdf[column]
+        else:
+            values = gdf[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                if categories is not None:
+                    raise ValueError(
+                        "Cannot specify 'categories' when column has categorical dtype"
+                    )
+                categorical = True
+            elif pd.api.types.is_object_dtype(values.dtype) or categories:
+                categorical = True
 
-        nan_idx = pd.isna(gdf[column])
+        # plain boolean array, cheaper to invert, index with and reduce
+        nan_idx = values.isna().to_numpy()
 
         if categorical:
-            cat = pd.Categorical(gdf[column][~nan_idx], categories=categories)
-            N = len(cat.categories)
+            values = values[~nan_idx]
+            if isinstance(values.dtype, pd.CategoricalDtype) and categories is None:
+                # reuse the existing Categorical instead of rebuilding it
+                codes, uniques = values.array.codes, values.array.categories
+            elif categories is None:
+                # the same codes and (sorted) categories pd.Categorical would
+                # infer, without constructing and validating a dtype
+                try:
+                    codes, uniques = pd.factorize(values, sort=True)
+                except TypeError:  # unsortable mix of types
+                    codes, uniques = pd.factorize(values)
+            else:
+                # hashed lookup of the given categories, -1 for unknown values
+                uniques = pd.Index(categories)
+                if not uniques.is_unique:
+                    raise ValueError("Categorical categories must be unique")
+                codes = uniques.get_indexer(values)
+                unknown = codes == -1
+                if unknown.any():
+                    # values not listed in categories are treated as missing
+                    nan_idx[np.flatnonzero(~nan_idx)[unknown]] = True
+                    codes = codes[~unknown]
+            N = len(uniques)
             cmap = cmap if cmap else "tab20"
 
-            # colormap exists in matplotlib
-            if cmap in plt.colormaps():
-
-                color = np.apply_along_axis(
-                    colors.to_hex, 1, cm.get_cmap(cmap, N)(cat.codes)
-                )
-                legend_colors = np.apply_along_axis(
-                    colors.to_hex, 1, cm.get_cmap(cmap, N)(range(N))
-                )
-
-            # custom list of colors
-            elif pd.api.types.is_list_like(cmap):
-                if N > len(cmap):
-                    cmap = cmap * (N // len(cmap) + 1)
-                color = np.take(cmap, cat.codes)
-                legend_colors = np.take(cmap, range(N))
+            # colormap exists in matplotlib or custom list of colors
+            if (
+                isinstance(cmap, str) and cmap in matplotlib.colormaps
+            ) or pd.api.types.is_list_like(cmap):
+                color, legend_colors = _colorize(codes, cmap, N, cycle=True)
 
             else:
                 raise ValueError(
@@ -354,23 +428,25 @@ def view(
             color = list(map(lambda x: cmap(x), df[column]))
 
         else:
-            vmin = gdf[column].min() if not vmin else vmin
-            vmax = gdf[column].max() if not vmax else vmax
+            valid_values = values[~nan_idx].to_numpy()
+            col_min, col_max = values.min(), values.max()
+            vmin = col_min if not vmin else vmin
+            vmax = col_max if not vmax else vmax
 
-            if vmin > gdf[column].min():
+            if vmin > col_min:
                 warn(
                     "'vmin' cannot be higher than minimum value. Setting vmin to minimum.",
                     UserWarning,
                     stacklevel=3,
                 )
-                vmin = gdf[column].min()
-            if vmax < gdf[column].max():
+                vmin = col_min
+            if vmax < col_max:
                 warn(
                     "'vmax' cannot be lower than maximum value. Setting vmax to maximum.",
                     UserWarning,
                     stacklevel=3,
                 )
-                vmax = gdf[column].max()
+                vmax = col_max
 
             # get bins
             if scheme is not None:
@@ -380,23 +456,17 @@ def view(
                 if "k" not in classification_kwds:
                     classification_kwds["k"] = k
 
-                binning = mapclassify.classify(
-                    np.asarray(gdf[column][~nan_idx]), scheme, **classification_kwds
-                )
-                color = np.apply_along_axis(
-                    colors.to_hex, 1, cm.get_cmap(cmap, k)(binning.yb)
-                )
+                binning = _classify(valid_values, scheme, **classification_kwds)
+                color, legend_colors = _colorize(binning.yb, cmap, binning.k)
 
             else:
 
+                # 256 equal-width bins closed on the right, the same as
+                # UserDefined classification but without its pass per bin
                 bins = np.linspace(vmin, vmax, 257)[1:]
-                binning = mapclassify.classify(
-                    np.asarray(gdf[column][~nan_idx]), "UserDefined", bins=bins
-                )
+                yb = np.searchsorted(bins, valid_values)
 
-                color = np.apply_along_axis(
-                    colors.to_hex, 1, cm.get_cmap(cmap, 256)(binning.yb)
-                )
+                color, _ = _colorize(yb, cmap, 256)
 
         # we cannot color default 'marker'
         if marker_type is None:
@@ -409,43 +479,53 @@ def view(
         style_kwds["weight"] = 2
 
     # specify color
-    if color is not None:
-        if (
-            isinstance(color, str)
-            and isinstance(gdf, gpd.GeoDataFrame)
-            and color in gdf.columns
-        ):  # use existing column
-            style_function = lambda x: {
-                "fillColor": x["properties"][color],
-                **style_kwds,
-            }
-        else:  # assign new column
-            if isinstance(gdf, gpd.GeoSeries):
-                gdf = gpd.GeoDataFrame(geometry=gdf)
-
-            if nan_idx is not None and nan_idx.any():
-                nan_color = missing_kwds.pop("color", None)
-
-                gdf["__folium_color"] = nan_color
-                gdf.loc[~nan_idx, "__folium_color"] = color
-            else:
-                gdf["__folium_color"] = color
-
-            stroke_color = style_kwds.pop("color", None)
-            if not stroke_color:
-                style_function = lambda x: {
-                    "fillColor": x["properties"]["__folium_color"],
-                    "color": x["properties"]["__folium_color"],
-                    **style_kwds,
-                }
-            else:
-                style_function = lambda x: {
-                    "fillColor": x["properties"]["__folium_color"],
-                    "color": stroke_color,
-                    **style_kwds,
-                }
-    else:  # use folium default
-        style_function = lambda x: {**style_kwds}
+    if color is None:
+        color_kind = "default"
+    elif (
+        isinstance(color, str)
+        and isinstance(gdf, gpd.GeoDataFrame)
+        and color in gdf.columns
+    ):
+        color_kind = "column"
+    else:
+        color_kind = "values"
+
+    if color_kind == "default":  # use folium default
+        # the same style applies to every feature, build it only once
+        style_function = lambda x, s=dict(style_kwds): s
+
+    elif color_kind == "column":  # use existing column
+        style_function = lambda x, c=color, s=dict(style_kwds): {
+            "fillColor": x["properties"][c],
+            **s,
+        }
+
+    else:  # assign new column
+        if isinstance(gdf, gpd.GeoSeries):
+            gdf = gpd.GeoDataFrame(geometry=gdf)
+
+        if nan_idx is not None and nan_idx.any():
+            nan_color = missing_kwds.pop("color", None)
+
+            # fill one array instead of broadcasting and then using .loc
+            folium_color = np.full(len(gdf), nan_color, dtype=object)
+            folium_color[~nan_idx] = color
+            gdf["__folium_color"] = folium_color
+        else:
+            gdf["__folium_color"] = color
+
+        # missing colors (e.g. NaN from aligning a color Series) are read back
+        # from the GeoJSON as None, use None as their key as well
+        folium_color = gdf["__folium_color"].astype(object)
+        gdf["__folium_color"] = folium_color.where(folium_color.notna(), None)
+
+        # one style dict per distinct color, shared by all features of that color
+        stroke_color = style_kwds.pop("color", None)
+        styles = {
+            c: {"fillColor": c, "color": stroke_color or c, **style_kwds}
+            for c in pd.unique(gdf["__folium_color"])
+        }
+        style_function = lambda x, s=styles: s[x["properties"]["__folium_color"]]
 
     if highlight:
         if not "fillOpacity" in highlight_kwds:
@@ -476,23 +556,58 @@ def view(
         tooltip = None
         popup = None
 
+    # values of a passed array are already encoded in "__folium_color",
+    # do not embed them in the GeoJSON again
+    if isinstance(gdf, gpd.GeoDataFrame) and "__plottable_column" in gdf.columns:
+        del gdf["__plottable_column"]
+
+    if minimal_properties and isinstance(gdf, gpd.GeoDataFrame):
+        keep = {gdf.geometry.name, "__folium_color"}
+        if color_kind == "column":
+            keep.add(color)
+        for fields in (tooltip, popup):
+            if fields is not None:
+                keep.update(fields.fields)
+        gdf = gdf[[c for c in gdf.columns if c in keep or str(c) in keep]]
+
     # add dataframe to map
-    folium.GeoJson(
-        gdf.__geo_interface__,
-        tooltip=tooltip,
-        popup=popup,
-        marker=marker,
-        style_function=style_function,
-        highlight_function=highlight_function,
-        **kwargs,
-    ).add_to(m)
-
-    if legend:
+    cluster = cluster and (gdf.geom_type == "Point").all()
+    if cluster:
+        if column is not None:
+            # clustered markers are not colored, a legend would be misleading
+            warn(
+                "'column' is not supported with 'cluster=True', points are not "
+                "colored and no legend is added.",
+                UserWarning,
+                stacklevel=3,
+            )
+        coords = shapely.get_coordinates(np.asarray(gdf.geometry.values))
+        cluster_kwds = {i: kwargs.pop(i) for i in _CLUSTER_KWARGS if i in kwargs}
+        if kwargs:
+            warn(
+                "Keywords {} are not supported with 'cluster=True' and are "
+                "ignored.".format(sorted(kwargs)),
+                UserWarning,
+                stacklevel=3,
+            )
+        plugins.FastMarkerCluster(coords[:, ::-1].tolist(), **cluster_kwds).add_to(m)
+    else:
+        folium.GeoJson(
+            _feature_collection(gdf),
+            tooltip=tooltip,
+            popup=popup,
+            marker=marker,
+            style_function=style_function,
+            highlight_function=highlight_function,
+            **kwargs,
+        ).add_to(m)
+
+    if legend and not cluster:
         # NOTE: overlaps should be resolved in branca https://github.com/python-visualization/branca/issues/88
         caption = column if not column == "__plottable_column" else ""
         caption = legend_kwds.pop("caption", caption)
         if categorical:
-            categories = cat.categories.to_list()
+            categories = uniques.to_list()
             legend_colors = legend_colors.tolist()
 
             if nan_idx.any() and nan_color:
@@ -504,9 +619,7 @@ def view(
 
             cbar = legend_kwds.pop("colorbar", True)
             if scheme:
-                cb_colors = np.apply_along_axis(
-                    colors.to_hex, 1, cm.get_cmap(cmap, binning.k)(range(binning.k))
-                )
+                cb_colors = legend_colors
                 if cbar:
                     if legend_kwds.pop("scale", True):
                         index = [vmin] + binning.bins.tolist()
@@ -536,9 +649,7 @@ def view(
                 else:
 
                     mp_cmap = cm.get_cmap(cmap)
-                    cb_colors = np.apply_along_axis(
-                        colors.to_hex, 1, mp_cmap(range(mp_cmap.N))
-                    )
+                    cb_colors = _colormap_colors(cmap, mp_cmap.N)
                     # linear legend
                     if mp_cmap.N > 20:
                         colorbar = bc.colormap.LinearColormap(
@@ -561,31 +672,229 @@ def view(
     return m
 
 
+def _set_geometry(gdf, geoms):
+    """replace active geometry of a (shallow-copied) GeoDataFrame or GeoSeries"""
+    if isinstance(geoms, gpd.GeoSeries):
+        geoms = geoms.values
+    if isinstance(gdf, gpd.GeoDataFrame):
+        gdf[gdf.geometry.name] = geoms
+        return gdf
+    return gpd.GeoSeries(geoms, index=gdf.index, name=gdf.name)
+
+
+def _feature_collection(gdf):
+    """GeoJSON FeatureCollection string of a GeoDataFrame or GeoSeries
+
+    Geometries are encoded by GEOS and properties by pandas, skipping the
+    intermediate dicts of ``__geo_interface__``.
+    """
+    parts = ['{"type":"FeatureCollection","features":[']
+    for chunk in _iter_features(gdf):
+        parts.append(chunk)
+        parts.append(",")
+    if len(parts) > 1:
+        parts.pop()  # trailing comma
+    parts.append("]}")
+    return "".join(parts)
+
+
+def _iter_features(gdf, chunksize=10000):
+    """yield comma-separated GeoJSON features of gdf in chunks of rows
+
+    Only one chunk of intermediate geometry and property strings is held in
+    memory at a time.
+    """
+    for start in range(0, len(gdf), chunksize):
+        chunk = gdf.iloc[start : start + chunksize]
+        geometries = shapely.to_geojson(np.asarray(chunk.geometry.values))
+        # GeoSeries and geometry-only frames have no properties to encode
+        if isinstance(chunk, gpd.GeoDataFrame) and chunk.shape[1] > 1:
+            properties = (
+                chunk.drop(columns=chunk.geometry.name)
+                .to_json(
+                    orient="records",
+                    lines=True,
+                    date_format="iso",
+                    double_precision=15,
+                )
+                .splitlines()
+            )
+        else:
+            properties = ["{}"] * len(chunk)
+
+        # feature ids are the index labels as strings, integer labels need no
+        # JSON escaping
+        if chunk.index.dtype.kind in "iu":
+            ids = [f'"{i}"' for i in chunk.index.tolist()]
+        else:
+            ids = [json.dumps(str(i)) for i in chunk.index]
+
+        yield ",".join(
+            f'{{"id":{i},"type":"Feature",'
+            f'"properties":{p},"geometry":{g or "null"}}}'
+            for i, p, g in zip(ids, properties, geometries)
+        )
+
+
+def _rgba_to_hex(rgba):
+    """vectorized matplotlib.colors.to_hex for an (n, 4) array of RGBA floats"""
+    # to_hex rounds half to even as well
+    rgb = np.round(np.asarray(rgba)[:, :3] * 255).astype(np.uint8)
+    hex_colors = np.char.add("#", _BYTE_HEX[rgb[:, 0]])
+    hex_colors = np.char.add(hex_colors, _BYTE_HEX[rgb[:, 1]])
+    return np.char.add(hex_colors, _BYTE_HEX[rgb[:, 2]])
+
+
+def _colorize(codes, cmap, n, cycle=False):
+    """colors of integer codes and the lookup table of n colors they index
+
+    A list-like of colors is only accepted with ``cycle=True`` (categorical
+    codes), where it is repeated if there are more codes than colors. Ordered
+    codes (classes, bins) need a matplotlib colormap.
+    """
+    if cycle and pd.api.types.is_list_like(cmap):
+        # repeat colors if there are more codes than colors
+        palette = np.asarray(cmap)
+        lut = palette[np.arange(n) % palette.size]
+    else:
+        lut = _colormap_colors(cmap, n)
+    # clipping mirrors the under/over colors of the colormap
+    return lut.take(codes, mode="clip"), lut
+
+
+def _colormap_colors(cmap, n):
+    """hex colors of a matplotlib colormap resampled to n colors"""
+    try:
+        return _colormap_colors_cached(cmap, n)
+    except TypeError:  # Colormap objects are not hashable
+        return _colormap_colors_cached.__wrapped__(cmap, n)
+
+
+@lru_cache(maxsize=32)
+def _colormap_colors_cached(cmap, n):
+    """cached _colormap_colors, returns a read-only array"""
+    hex_colors = _rgba_to_hex(cm.get_cmap(cmap, n)(range(n)))
+    hex_colors.setflags(write=False)
+    return hex_colors
+
+
+def _classify(values, scheme, **classification_kwds):
+    """classify values using mapclassify, reusing results of identical calls"""
+    import mapclassify
+
+    values = np.ascontiguousarray(values)
+    try:
+        kwds = frozenset(classification_kwds.items())
+    except TypeError:
+        # unhashable options (e.g. list of bins) cannot be used as a cache key
+        return mapclassify.classify(values, scheme, **classification_kwds)
+    if values.dtype.kind not in "biuf":
+        return mapclassify.classify(values, scheme, **classification_kwds)
+
+    # key on a fixed-size digest rather than the raw bytes; the cached results
+    # still reference their values (``.y``), hence the small cache size
+    digest = hashlib.blake2b(values, digest_size=16).digest()
+    key = (digest, values.dtype.str, values.size, scheme, kwds)
+    if key in _CLASSIFY_CACHE:
+        _CLASSIFY_CACHE.move_to_end(key)
+        return _CLASSIFY_CACHE[key]
+
+    binning = mapclassify.classify(values, scheme, **classification_kwds)
+    _CLASSIFY_CACHE[key] = binning
+    if len(_CLASSIFY_CACHE) > _CLASSIFY_CACHE_SIZE:
+        _CLASSIFY_CACHE.popitem(last=False)
+    return binning
+
+
 def _tooltip_popup(type, fields, gdf, **kwds):
     """get tooltip or popup"""
     # specify fields to show in the tooltip
     if fields is False or fields is None or fields == 0:
         return None
-    else:
-        if fields is True:
-            fields = gdf.columns.drop(gdf.geometry.name).to_list()
-        elif isinstance(fields, int):
-            fields = gdf.columns.drop(gdf.geometry.name).to_list()[:fields]
-        elif isinstance(fields, str):
-            fields = [fields]
-
-    for field in ["__plottable_column", "__folium_color"]:
-        if field in fields:
-            fields.remove(field)
-
-    # Cast fields to str
-    fields = list(map(str, fields))
+
+    skip = _INTERNAL_COLS | {gdf.geometry.name}
+    n = None
+    if isinstance(fields, int):  # True or number of columns
+        n = None if fields is True else fields
+        fields = gdf.columns
+    elif isinstance(fields, str):
+        fields = [fields]
+
+    # drop geometry and internal columns and cast fields to str
+    fields = [str(f) for f in fields if f not in skip][:n]
     if type == "tooltip":
         return folium.GeoJsonTooltip(fields, **kwds)
     elif type == "popup":
         return folium.GeoJsonPopup(fields, **kwds)
 
 
+# CSS and JS of categorical legends, added to the header of a map once
+_LEGEND_HEADER = """
+{% macro header(this, kwargs) %}
+<script src="https://code.jquery.com/ui/1.12.1/jquery-ui.js"></script>
+<script>$( function() {
+    $( ".maplegend" ).draggable({
+        start: function (event, ui) {
+            $(this).css({
+                right: "auto",
+                top: "auto",
+                bottom: "auto"
+            });
+        }
+    });
+});
+</script>
+<style type='text/css'>
+  .maplegend {
+    position: absolute;
+    z-index:9999;
+    background-color: rgba(255, 255, 255, .8);
+    border-radius: 5px;
+    box-shadow: 0 0 15px rgba(0,0,0,0.2);
+    padding: 10px;
+    font: 12px/14px Arial, Helvetica, sans-serif;
+    right: 10px;
+    bottom: 20px;
+  }
+  .maplegend .legend-title {
+    text-align: left;
+    margin-bottom: 5px;
+    font-weight: bold;
+    }
+  .maplegend .legend-scale ul {
+    margin: 0;
+    margin-bottom: 0px;
+    padding: 0;
+    float: left;
+    list-style: none;
+    }
+  .maplegend .legend-scale ul li {
+    list-style: none;
+    margin-left: 0;
+    line-height: 16px;
+    margin-bottom: 2px;
+    }
+  .maplegend ul.legend-labels li span {
+    display: block;
+    float: left;
+    height: 14px;
+    width: 14px;
+    margin-right: 5px;
+    margin-left: 0;
+    border: 0px solid #ccc;
+    }
+  .maplegend .legend-source {
+    color: #777;
+    clear: both;
+    }
+  .maplegend a {
+    color: #777;
+    }
+</style>
+{% endmacro %}
+"""
+
+
 def _categorical_legend(m, title, categories, colors):
     """
     Add categorical legend to a map
@@ -608,76 +917,13 @@ def _categorical_legend(m, title, categories, colors):
         list of colors (in the same order as categories)
     """
 
-    # Header to Add
-    head = """
-    {% macro header(this, kwargs) %}
-    <script src="https://code.jquery.com/ui/1.12.1/jquery-ui.js"></script>
-    <script>$( function() {
-        $( ".maplegend" ).draggable({
-            start: function (event, ui) {
-                $(this).css({
-                    right: "auto",
-                    top: "auto",
-                    bottom: "auto"
-                });
-            }
-        });
-    });
-    </script>
-    <style type='text/css'>
-      .maplegend {
-        position: absolute;
-        z-index:9999;
-        background-color: rgba(255, 255, 255, .8);
-        border-radius: 5px;
-        box-shadow: 0 0 15px rgba(0,0,0,0.2);
-        padding: 10px;
-        font: 12px/14px Arial, Helvetica, sans-serif;
-        right: 10px;
-        bottom: 20px;
-      }
-      .maplegend .legend-title {
-        text-align: left;
-        margin-bottom: 5px;
-        font-weight: bold;
-        }
-      .maplegend .legend-scale ul {
-        margin: 0;
-        margin-bottom: 0px;
-        padding: 0;
-        float: left;
-        list-style: none;
-        }
-      .maplegend .legend-scale ul li {
-        list-style: none;
-        margin-left: 0;
-        line-height: 16px;
-        margin-bottom: 2px;
-        }
-      .maplegend ul.legend-labels li span {
-        display: block;
-        float: left;
-        height: 14px;
-        width: 14px;
-        margin-right: 5px;
-        margin-left: 0;
-        border: 0px solid #ccc;
-        }
-      .maplegend .legend-source {
-        color: #777;
-        clear: both;
-        }
-      .maplegend a {
-        color: #777;
-        }
-    </style>
-    {% endmacro %}
-    """
-
-    # Add CSS (on Header)
-    macro = bc.element.MacroElement()
-    macro._template = bc.element.Template(head)
-    m.get_root().add_child(macro)
+    # Add CSS (on Header), only once per map
+    root = m.get_root()
+    if not getattr(root, "_legend_header_added", False):
+        macro = bc.element.MacroElement()
+        macro._template = bc.element.Template(_LEGEND_HEADER)
+        root.add_child(macro)
+        root._legend_header_added = True
 
     body = f"""
     <div id='maplegend {title}' class='maplegend'>
@@ -686,9 +932,11 @@ def _categorical_legend(m, title, categories, colors):
             <ul class='legend-labels'>"""
 
     # Loop Categories
-    for label, color in zip(categories, colors):
-        body += f"""
+    body += "".join(
+        f"""
                 <li><span style='background:{color}'></span>{label}</li>"""
+        for label, color in zip(categories, colors)
+    )
 
     body += """
             </ul>
@@ -6,6 +6,12 @@ setuptools.setup(
     author="Martin Fleischmann",
     author_email="martin@martinfleischmann.net",
     python_requires=">=3.6",
-    install_requires=["geopandas", "folium", "mapclassify", "matplotlib"],
+    install_requires=[
+        "geopandas",
+        "folium",
+        "mapclassify",
+        "matplotlib",
+        "shapely>=2.0",
+    ],
     packages=setuptools.find_packages(),
 )